@@ -1,14 +1,50 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
-from neo4j import GraphDatabase
+from flask import Flask, render_template, stream_template, request, redirect, url_for, flash, session, jsonify, make_response, get_flashed_messages, abort
+from flask.globals import request_ctx
+from jinja2 import FileSystemBytecodeCache
+from neo4j import GraphDatabase, READ_ACCESS
+from neo4j.exceptions import Neo4jError
 from werkzeug.security import generate_password_hash, check_password_hash
 import os
+import atexit
+import hashlib
+import pickle
+import threading
+import time
 from dotenv import dotenv_values
 from datetime import datetime, timezone
-from rdflib import Graph as RDFGraph, Namespace, URIRef, Literal
-from rdflib.namespace import RDF, RDFS, XSD
+from rdflib import Namespace, URIRef, Literal, BNode
+from rdflib.namespace import RDF, XSD
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
 import difflib
 import re
-from urllib.parse import urlsplit, urlunsplit, quote, unquote
+import unicodedata
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from urllib.parse import urlsplit, urlunsplit, unquote
+
+try:
+    # Optional C++ similarity ratio, used to prune search candidates; difflib alone is used when missing
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = None
+    process = None
+
+try:
+    # Optional argon2 hasher for new passwords; existing Werkzeug hashes keep verifying
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+    _password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+except ImportError:
+    _password_hasher = None
+
+try:
+    # Optional Rust N-Triples parser; rdflib's parser is used when missing
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
 
 # Prefer reading secrets directly from the interface/.env file (not the OS environment).
 # This returns a dict of values in the .env file. If a key is missing there we fall back to
@@ -28,32 +64,167 @@ except Exception:
 app = Flask(__name__)
 # Read secret key from .env file first, fallback to a dev value if missing
 app.config['SECRET_KEY'] = env_values.get('FLASK_SECRET_KEY') or 'dev-secret-change-in-prod'
+# Reject oversized request bodies before Werkzeug parses them
+app.config['MAX_CONTENT_LENGTH'] = 1_000_000
+
+# Keep compiled templates on disk so new workers skip Jinja's parse/compile step. Template
+# auto-reload already follows debug mode, and Jinja's default cache_size (400) holds every template.
+# Cached bytecode is executed, so without an explicit JINJA_CACHE_DIR Jinja picks its own
+# per-user temp folder (mode 0700, owner checked) rather than a shared, guessable path.
+JINJA_CACHE_DIR = env_values.get('JINJA_CACHE_DIR')
+try:
+    if JINJA_CACHE_DIR:
+        os.makedirs(JINJA_CACHE_DIR, mode=0o700, exist_ok=True)
+    app.jinja_options = {**app.jinja_options, 'bytecode_cache': FileSystemBytecodeCache(JINJA_CACHE_DIR)}
+except (OSError, RuntimeError):
+    # RuntimeError: Jinja refused a default cache folder it does not safely own
+    pass
+
+
+# Filled with the shared term objects once the triple indexes are loaded
+_TERMS = {}
+
+
+class _IndexedNamespace(Namespace):
+    # rdflib's Namespace builds (and validates) a new URIRef on every attribute access. Once a
+    # term is known to the triple indexes, return and remember that shared object instead, so
+    # index lookups compare keys by identity.
+    def __getattr__(self, name):
+        term = super().__getattr__(name)
+        if term in _TERMS:
+            term = _TERMS[term]
+            self.__dict__[name] = term
+        return term
 
 
 # Namespaces for RDF graph
-SCHEMA = Namespace("http://schema.org/")
-COURSES = Namespace("https://w3id.org/def/courses#")
-EDUCOR = Namespace("https://github.com/tibonto/educor#")
+SCHEMA = _IndexedNamespace("http://schema.org/")
+COURSES = _IndexedNamespace("https://w3id.org/def/courses#")
+EDUCOR = _IndexedNamespace("https://github.com/tibonto/educor#")
 
 # Load RDF graph from mapping_rules/output.nt (N-Triples)
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 RDF_FILE = os.path.join(REPO_ROOT, 'mapping_rules', 'output.nt')
-_rdf_graph = None
+
+
+def _from_oxigraph(term):
+    # Convert a pyoxigraph term into the equivalent rdflib term
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        return BNode(term.value)
+    if term.language:
+        return Literal(term.value, lang=term.language)
+    if term.datatype.value == str(XSD.string):
+        return Literal(term.value)
+    return Literal(term.value, datatype=URIRef(term.datatype.value))
+
+
+def _index_triples(triples):
+    # (subject, predicate) -> objects and (predicate, object) -> subjects, in the order the
+    # triples are given (file order), plus the number of distinct triples. Duplicates are
+    # dropped, as an rdflib Graph would.
+    # Equal terms are also collapsed to one shared object, so dict lookups on index keys hit
+    # by identity instead of falling back to rdflib's Python-level __eq__.
+    objects_index = defaultdict(list)
+    subjects_index = defaultdict(list)
+    terms = {}
+    seen = set()
+    for triple in triples:
+        if triple in seen:
+            continue
+        seen.add(triple)
+        s, p, o = (terms.setdefault(term, term) for term in triple)
+        objects_index[(s, p)].append(o)
+        subjects_index[(p, o)].append(s)
+    return dict(objects_index), dict(subjects_index), len(seen)
+
+
+class _TripleCollector:
+    # Minimal sink for rdflib's N-Triples parser: records triples in file order without
+    # building a Graph and its store indexes.
+    def __init__(self):
+        self.triples = []
+
+    def triple(self, s, p, o):
+        self.triples.append((s, p, o))
+
+
+def _load_rdf_indexes(path):
+    if pyoxigraph is not None:
+        return _index_triples(
+            (_from_oxigraph(t.subject), _from_oxigraph(t.predicate), _from_oxigraph(t.object))
+            for t in pyoxigraph.parse(path=path, format=pyoxigraph.RdfFormat.N_TRIPLES)
+        )
+    collector = _TripleCollector()
+    with open(path, 'rb') as fh:
+        W3CNTriplesParser(sink=collector).parse(fh)
+    return _index_triples(collector.triples)
+
+
+# Parsed indexes are pickled next to the N-Triples file and reused while the file's
+# mtime/size match, so workers skip parsing on start. Bump the version when the index
+# layout changes.
+RDF_INDEX_CACHE = RDF_FILE + '.pkl'
+_RDF_INDEX_VERSION = 3
+
+
+def _load_rdf_indexes_cached(path):
+    st = os.stat(path)
+    signature = (_RDF_INDEX_VERSION, st.st_mtime_ns, st.st_size)
+    try:
+        with open(RDF_INDEX_CACHE, 'rb') as fh:
+            snapshot = pickle.load(fh)
+        if snapshot.get('signature') == signature:
+            return snapshot['indexes']
+    except Exception:
+        pass
+    indexes = _load_rdf_indexes(path)
+    # Write atomically; a read-only deployment simply keeps parsing on start
+    tmp_path = f'{RDF_INDEX_CACHE}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as fh:
+            pickle.dump({'signature': signature, 'indexes': indexes}, fh, protocol=5)
+        os.replace(tmp_path, RDF_INDEX_CACHE)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return indexes
+
+
+# The graph is read-only, so every lookup goes through these indexes; no triple store is kept.
+# The triple count is taken while indexing (and kept in the snapshot), so /status never scans.
+_OBJECTS_INDEX, _SUBJECTS_INDEX, _rdf_triple_count = {}, {}, 0
 try:
-    g = RDFGraph()
     if os.path.exists(RDF_FILE):
-        g.parse(RDF_FILE, format='nt')
-        _rdf_graph = g
-    else:
-        _rdf_graph = None
+        _OBJECTS_INDEX, _SUBJECTS_INDEX, _rdf_triple_count = _load_rdf_indexes_cached(RDF_FILE)
 except Exception:
-    _rdf_graph = None
+    _OBJECTS_INDEX, _SUBJECTS_INDEX, _rdf_triple_count = {}, {}, 0
+# Shared term objects from the indexes (see _IndexedNamespace); the pickled snapshot keeps
+# the sharing intact.
+_TERMS = {term: term for (s, p), objs in _OBJECTS_INDEX.items() for term in (s, p, *objs)}
+
+
+def _objects(s, p):
+    return _OBJECTS_INDEX.get((s, p), ())
+
 
+def _subjects(p, o):
+    return _SUBJECTS_INDEX.get((p, o), ())
 
+
+# Provider type membership, checked for every provider of every course
+_ORG_SUBJECTS = set(_subjects(RDF.type, SCHEMA.EducationalOrganization)) | set(_subjects(RDF.type, SCHEMA.CollegeOrUniversity))
+_PERSON_SUBJECTS = set(_subjects(RDF.type, SCHEMA.Person))
+
+
+@lru_cache(maxsize=100_000)
 def _first_literal(s, p):
-    if not _rdf_graph:
+    if not _OBJECTS_INDEX:
         return None
-    for o in _rdf_graph.objects(s, p):
+    for o in _objects(s, p):
         if isinstance(o, Literal):
             return str(o)
         # if it's a URI, try to find its name
@@ -64,10 +235,11 @@ def _first_literal(s, p):
     return None
 
 
+@lru_cache(maxsize=100_000)
 def _bool_value(s, p):
-    if not _rdf_graph:
+    if not _OBJECTS_INDEX:
         return None
-    for o in _rdf_graph.objects(s, p):
+    for o in _objects(s, p):
         if isinstance(o, Literal):
             if o.datatype == XSD.boolean:
                 return bool(str(o).lower() == 'true')
@@ -80,13 +252,14 @@ def _bool_value(s, p):
     return None
 
 
+@lru_cache(maxsize=100_000)
 def _get_level_value(subject):
     """Return a readable educational level value from triples.
     Prefers a literal; if URI, tries schema:name, else falls back to URI string.
     """
-    if not _rdf_graph:
+    if not _OBJECTS_INDEX:
         return None
-    for o in _rdf_graph.objects(subject, SCHEMA.educationalLevel):
+    for o in _objects(subject, SCHEMA.educationalLevel):
         if isinstance(o, Literal):
             return str(o)
         if isinstance(o, URIRef):
@@ -95,6 +268,20 @@ def _get_level_value(subject):
     return None
 
 
+# Keyword groups for _short_level_label in priority order. Each alternative is a lookahead
+# over the whole string, so one match() returns the first category (not the leftmost
+# keyword) that occurs anywhere; the group name is the short label.
+_LEVEL_RE = re.compile(
+    r'(?=.*?(?P<PhD>phd|doctoral|doctorate|dphil))'
+    r'|(?=.*?(?P<Master>master|msc|m\.sc|gradua))'
+    r'|(?=.*?(?P<Bachelor>bachelor|undergrad|bsc|b\.sc|ba))'
+    r'|(?=.*?(?P<HS>high|secondary))'
+    r'|(?=.*?(?P<Cert>diploma|certificate|cert))'
+    r'|(?=.*?(?P<Associate>associate))',
+    re.DOTALL
+)
+
+
 def _short_level_label(val: str) -> str:
     if not val:
         return ''
@@ -102,42 +289,54 @@ def _short_level_label(val: str) -> str:
     # take last fragment if URI-like
     if '/' in s or '#' in s:
         s = s.split('#')[-1].split('/')[-1]
-    low = s.lower()
     # normalize common categories
-    if any(k in low for k in ['phd', 'doctoral', 'doctorate', 'dphil']):
-        return 'PhD'
-    if any(k in low for k in ['master', 'msc', 'm.sc', 'gradua']):
-        return 'Master'
-    if any(k in low for k in ['bachelor', 'undergrad', 'bsc', 'b.sc', 'ba']):
-        return 'Bachelor'
-    if any(k in low for k in ['high', 'secondary']):
-        return 'HS'
-    if any(k in low for k in ['diploma', 'certificate', 'cert']):
-        return 'Cert'
-    if 'associate' in low:
-        return 'Associate'
+    m = _LEVEL_RE.match(s.lower())
+    if m:
+        return m.lastgroup
     # fallback: split camel case and truncate
     s = re.sub(r'([a-z])([A-Z])', r'\1 \2', s)
     return (s[:12] + '…') if len(s) > 13 else s
 
 
+def _canonical_uri(uri: str) -> str:
+    # Comparison key for URIs that may arrive percent-encoded zero, one or two times:
+    # fully decode, NFC-normalize and lowercase the scheme and host.
+    for _ in range(3):
+        decoded = unquote(uri)
+        if decoded == uri:
+            break
+        uri = decoded
+    parts = urlsplit(unicodedata.normalize('NFC', uri))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, parts.fragment))
+
+
+# Course subjects by exact URI string and by canonical URI, for detail lookups
+_COURSE_BY_URI = {str(s): s for s in _subjects(RDF.type, SCHEMA.Course)}
+_COURSE_BY_CANONICAL = {}
+for _uri, _course in _COURSE_BY_URI.items():
+    _COURSE_BY_CANONICAL.setdefault(_canonical_uri(_uri), _course)
+
+
+# The RDF graph is loaded once and treated as read-only, so the derived views below are
+# memoized per process. Call invalidate_rdf_cache() if the RDF file is ever reloaded.
+@lru_cache(maxsize=None)
 def list_courses_from_rdf():
-    if not _rdf_graph:
+    if not _OBJECTS_INDEX:
         return []
     courses = []
-    for course in _rdf_graph.subjects(RDF.type, SCHEMA.Course):
+    for course in _subjects(RDF.type, SCHEMA.Course):
         name = _first_literal(course, SCHEMA.name)
         url = _first_literal(course, SCHEMA.url)
         # Providers (kept for detail view, but not shown in list by default)
         providers = []
         seen = set()
         for pred in (SCHEMA.provider, COURSES.responsibleEntity):
-            for p in _rdf_graph.objects(course, pred):
+            for p in _objects(course, pred):
                 pid = str(p)
                 if pid in seen:
                     continue
                 seen.add(pid)
-                ptype = 'Organization' if ((p, RDF.type, SCHEMA.EducationalOrganization) in _rdf_graph or (p, RDF.type, SCHEMA.CollegeOrUniversity) in _rdf_graph) else ('Person' if (p, RDF.type, SCHEMA.Person) in _rdf_graph else None)
+                ptype = 'Organization' if p in _ORG_SUBJECTS else ('Person' if p in _PERSON_SUBJECTS else None)
                 providers.append({
                     'uri': pid,
                     'name': _first_literal(p, SCHEMA.name) or pid,
@@ -145,14 +344,15 @@ def list_courses_from_rdf():
                 })
 
         # Topic and skill counts for compact list view
-        topic_count = sum(1 for _ in _rdf_graph.objects(course, SCHEMA.teaches))
+        topics = _objects(course, SCHEMA.teaches)
+        topic_count = len(topics)
         skill_seen = set()
-        for t in _rdf_graph.objects(course, SCHEMA.teaches):
-            for s in _rdf_graph.subjects(EDUCOR.requiresKnowledge, t):
-                for c in _rdf_graph.objects(s, COURSES.skillRequired):
+        for t in topics:
+            for s in _subjects(EDUCOR.requiresKnowledge, t):
+                for c in _objects(s, COURSES.skillRequired):
                     skill_seen.add(str(c))
-            for s in _rdf_graph.subjects(SCHEMA.teaches, t):
-                for c in _rdf_graph.objects(s, COURSES.skillRequired):
+            for s in _subjects(SCHEMA.teaches, t):
+                for c in _objects(s, COURSES.skillRequired):
                     skill_seen.add(str(c))
         skills_count = len(skill_seen)
 
@@ -168,59 +368,25 @@ def list_courses_from_rdf():
     return courses
 
 
+@lru_cache(maxsize=None)
+def _course_list_totals():
+    # Catalog-wide topic/skill totals for the /courses summary cards, independent of the page shown
+    courses = list_courses_from_rdf()
+    return sum(c['topic_count'] for c in courses), sum(c['skills_count'] for c in courses)
+
+
+@lru_cache(maxsize=512)
 def course_detail_from_rdf(course_id_or_name: str):
-    if not _rdf_graph:
+    if not _OBJECTS_INDEX:
         return None
     target = None
     # attempt to resolve by URI
     if course_id_or_name and (course_id_or_name.startswith('http') or course_id_or_name.lower().startswith('http%3a') or course_id_or_name.lower().startswith('https%3a')):
-        # Try multiple normalization variants to match graph URIs exactly
-        variants = []
-        raw = course_id_or_name
-        variants.append(raw)
-        try:
-            variants.append(unquote(raw))
-            variants.append(unquote(unquote(raw)))
-        except Exception:
-            pass
-        # Attempt direct URIRef match, then with normalized path encoding
-        for v in variants:
-            try:
-                cand = URIRef(v)
-                if (cand, RDF.type, SCHEMA.Course) in _rdf_graph:
-                    target = cand
-                    break
-                parts = urlsplit(v)
-                # If path contains spaces, encode them; if it contains %25 patterns, unquote once then encode
-                path_in = parts.path
-                if '%25' in path_in:
-                    try:
-                        path_in = unquote(path_in)
-                    except Exception:
-                        pass
-                path_q = quote(path_in, safe='/:@&+?$,;=%')
-                query_q = quote(parts.query, safe='=:&+/,%')
-                frag_q = quote(parts.fragment, safe='=:&+/,%')
-                uri_norm = urlunsplit((parts.scheme, parts.netloc, path_q, query_q, frag_q))
-                cand2 = URIRef(uri_norm)
-                if (cand2, RDF.type, SCHEMA.Course) in _rdf_graph:
-                    target = cand2
-                    break
-            except Exception:
-                continue
-        if not target:
-            # Fallback: scan all course subjects comparing to each variant and their unquoted forms
-            for s in _rdf_graph.subjects(RDF.type, SCHEMA.Course):
-                s_str = str(s)
-                for v in variants:
-                    if s_str == v or unquote(s_str) == v:
-                        target = s
-                        break
-                if target:
-                    break
+        # Exact match first, then the canonical form covers quoted/double-quoted/unquoted ids
+        target = _COURSE_BY_URI.get(course_id_or_name) or _COURSE_BY_CANONICAL.get(_canonical_uri(course_id_or_name))
     else:
         # resolve by name
-        for s in _rdf_graph.subjects(RDF.type, SCHEMA.Course):
+        for s in _subjects(RDF.type, SCHEMA.Course):
             if _first_literal(s, SCHEMA.name) == course_id_or_name:
                 target = s
                 break
@@ -233,12 +399,12 @@ def course_detail_from_rdf(course_id_or_name: str):
     providers = []
     seen = set()
     for pred in (SCHEMA.provider, COURSES.responsibleEntity):
-        for p in _rdf_graph.objects(target, pred):
+        for p in _objects(target, pred):
             pid = str(p)
             if pid in seen:
                 continue
             seen.add(pid)
-            ptype = 'Organization' if ((p, RDF.type, SCHEMA.EducationalOrganization) in _rdf_graph or (p, RDF.type, SCHEMA.CollegeOrUniversity) in _rdf_graph) else ('Person' if (p, RDF.type, SCHEMA.Person) in _rdf_graph else None)
+            ptype = 'Organization' if p in _ORG_SUBJECTS else ('Person' if p in _PERSON_SUBJECTS else None)
             providers.append({
                 'uri': pid,
                 'name': _first_literal(p, SCHEMA.name) or pid,
@@ -247,11 +413,12 @@ def course_detail_from_rdf(course_id_or_name: str):
                 'email': _first_literal(p, SCHEMA.email) if ptype == 'Person' else None,
             })
 
+    teaches = _objects(target, SCHEMA.teaches)
     topics = []
     level_counts = {}
     theoretical_count = 0
     practical_count = 0
-    for t in _rdf_graph.objects(target, SCHEMA.teaches):
+    for t in teaches:
         tname = _first_literal(t, SCHEMA.name) or str(t)
         theoretical = _bool_value(t, COURSES.theoreticalTopic)
         main = _bool_value(t, COURSES.mainTopic)
@@ -274,10 +441,10 @@ def course_detail_from_rdf(course_id_or_name: str):
     # Related skills via skills that require or teach these topics
     related_skills = []
     skill_seen = set()
-    for t in _rdf_graph.objects(target, SCHEMA.teaches):
+    for t in teaches:
         # skills that require knowledge of t
-        for s in _rdf_graph.subjects(EDUCOR.requiresKnowledge, t):
-            for c in _rdf_graph.objects(s, COURSES.skillRequired):
+        for s in _subjects(EDUCOR.requiresKnowledge, t):
+            for c in _objects(s, COURSES.skillRequired):
                 cid = str(c)
                 if cid in skill_seen:
                     continue
@@ -288,8 +455,8 @@ def course_detail_from_rdf(course_id_or_name: str):
                     'educationalLevel': _first_literal(c, SCHEMA.educationalLevel)
                 })
         # skills that teach t
-        for s in _rdf_graph.subjects(SCHEMA.teaches, t):
-            for c in _rdf_graph.objects(s, COURSES.skillRequired):
+        for s in _subjects(SCHEMA.teaches, t):
+            for c in _objects(s, COURSES.skillRequired):
                 cid = str(c)
                 if cid in skill_seen:
                     continue
@@ -316,25 +483,25 @@ def course_detail_from_rdf(course_id_or_name: str):
     }
 
 
+
+def course_details_from_rdf(ids):
+    # {id: detail} for every id that resolves; unknown ids are left out
+    details = {}
+    for course_id in ids:
+        if course_id and course_id not in details:
+            detail = course_detail_from_rdf(course_id)
+            if detail:
+                details[course_id] = detail
+    return details
+
+
 def _text(o):
     if o is None:
         return ''
     return str(o)
 
 
-def _string_similarity(a: str, b: str) -> float:
-    a = (a or '').strip().lower()
-    b = (b or '').strip().lower()
-    if not a or not b:
-        return 0.0
-    # Boost exact or substring matches
-    if a == b:
-        return 1.0
-    if a in b or b in a:
-        return 0.85
-    return difflib.SequenceMatcher(None, a, b).ratio()
-
-
+@lru_cache(maxsize=512)
 def _summarize_course_for_search(course_uri: URIRef):
     name = _first_literal(course_uri, SCHEMA.name)
     url = _first_literal(course_uri, SCHEMA.url)
@@ -342,24 +509,26 @@ def _summarize_course_for_search(course_uri: URIRef):
     providers = []
     seen = set()
     for pred in (SCHEMA.provider, COURSES.responsibleEntity):
-        for p in _rdf_graph.objects(course_uri, pred):
+        for p in _objects(course_uri, pred):
             pid = str(p)
             if pid in seen:
                 continue
             seen.add(pid)
-            ptype = 'Organization' if ((p, RDF.type, SCHEMA.EducationalOrganization) in _rdf_graph or (p, RDF.type, SCHEMA.CollegeOrUniversity) in _rdf_graph) else ('Person' if (p, RDF.type, SCHEMA.Person) in _rdf_graph else None)
+            ptype = 'Organization' if p in _ORG_SUBJECTS else ('Person' if p in _PERSON_SUBJECTS else None)
             providers.append({
                 'uri': pid,
                 'name': _first_literal(p, SCHEMA.name) or pid,
                 'type': ptype
             })
 
-    # Topics and levels
+    # Topics, levels and related skills in a single pass over the taught topics
     topics = []
     level_counts = {}
     theoretical_count = 0
     practical_count = 0
-    for t in _rdf_graph.objects(course_uri, SCHEMA.teaches):
+    skill_seen = set()
+    skills = []
+    for t in _objects(course_uri, SCHEMA.teaches):
         tname = _first_literal(t, SCHEMA.name) or str(t)
         theoretical = _bool_value(t, COURSES.theoreticalTopic)
         if theoretical is True:
@@ -373,48 +542,43 @@ def _summarize_course_for_search(course_uri: URIRef):
         main = _bool_value(t, COURSES.mainTopic)
         topics.append({'uri': str(t), 'name': tname, 'educationalLevel': level_short, 'theoretical': theoretical, 'main': main})
 
-    # Skills related via skills
-    skill_seen = set()
-    skill_count = 0
-    skills = []
-    for t in _rdf_graph.objects(course_uri, SCHEMA.teaches):
-        for s in _rdf_graph.subjects(EDUCOR.requiresKnowledge, t):
-            for c in _rdf_graph.objects(s, COURSES.skillRequired):
-                cid = str(c)
-                if cid in skill_seen:
-                    continue
-                skill_seen.add(cid)
-                skill_count += 1
-                skills.append({'uri': cid, 'name': _first_literal(c, SCHEMA.name) or cid})
-        for s in _rdf_graph.subjects(SCHEMA.teaches, t):
-            for c in _rdf_graph.objects(s, COURSES.skillRequired):
-                cid = str(c)
-                if cid in skill_seen:
-                    continue
-                skill_seen.add(cid)
-                skill_count += 1
-                skills.append({'uri': cid, 'name': _first_literal(c, SCHEMA.name) or cid})
-
-    # Build a small network graph (nodes/edges)
+        # Skills via subjects that require knowledge of t or teach t
+        for pred in (EDUCOR.requiresKnowledge, SCHEMA.teaches):
+            for s in _subjects(pred, t):
+                for c in _objects(s, COURSES.skillRequired):
+                    cid = str(c)
+                    if cid in skill_seen:
+                        continue
+                    skill_seen.add(cid)
+                    skills.append({'uri': cid, 'name': _first_literal(c, SCHEMA.name) or cid})
+
+    # Build a small network graph (nodes/edges); node_ids keeps the duplicate check O(1)
     nodes = []
     edges = []
-    nodes.append({'id': str(course_uri), 'label': name or 'Course', 'group': 'Course'})
+    course_id = str(course_uri)
+    node_ids = {course_id}
+    nodes.append({'id': course_id, 'label': name or 'Course', 'group': 'Course'})
     # Providers
     for p in providers[:6]:
-        nodes.append({'id': p['uri'], 'label': p['name'], 'group': p['type'] or 'Provider'})
-        edges.append({'from': str(course_uri), 'to': p['uri'], 'label': 'provider'})
+        if p['uri'] not in node_ids:
+            node_ids.add(p['uri'])
+            nodes.append({'id': p['uri'], 'label': p['name'], 'group': p['type'] or 'Provider'})
+        edges.append({'from': course_id, 'to': p['uri'], 'label': 'provider'})
     # Topics
     limited_topics = topics[:12]
     included_topic_ids = {t['uri'] for t in limited_topics}
     for t in limited_topics:
-        nodes.append({'id': t['uri'], 'label': t['name'], 'group': 'Topic'})
-        edges.append({'from': str(course_uri), 'to': t['uri'], 'label': 'teaches'})
+        if t['uri'] not in node_ids:
+            node_ids.add(t['uri'])
+            nodes.append({'id': t['uri'], 'label': t['name'], 'group': 'Topic'})
+        edges.append({'from': course_id, 'to': t['uri'], 'label': 'teaches'})
 
     # Skills (from skill_required logic above)
     for s in skills:
-        if not any(n['id'] == s['uri'] for n in nodes):
+        if s['uri'] not in node_ids:
+            node_ids.add(s['uri'])
             nodes.append({'id': s['uri'], 'label': s['name'], 'group': 'Skill'})
-        edges.append({'from': str(course_uri), 'to': s['uri'], 'label': 'skill'})
+        edges.append({'from': course_id, 'to': s['uri'], 'label': 'skill'})
 
     skills_shown = sum(1 for n in nodes if n.get('group') == 'Skill')
 
@@ -438,8 +602,67 @@ def _summarize_course_for_search(course_uri: URIRef):
     }
 
 
+# Course names/descriptions prepared once for search: (course, name, description) rows plus
+# the stripped, lowercased keys the similarity score is computed on.
+_COURSE_SEARCH_ROWS = [
+    (course, _first_literal(course, SCHEMA.name) or '', _first_literal(course, SCHEMA.description) or '')
+    for course in _subjects(RDF.type, SCHEMA.Course)
+]
+_COURSE_NAME_KEYS = [name.strip().lower() for _, name, _ in _COURSE_SEARCH_ROWS]
+_COURSE_DESC_KEYS = [desc.strip().lower() for _, _, desc in _COURSE_SEARCH_ROWS]
+
+
+_prepared_matchers = threading.local()
+
+
+def _matchers_for(keys):
+    # difflib fallback: one SequenceMatcher per key with the key already analysed as seq2,
+    # so a search only binds the query (set_seq1). Per thread, since matchers are mutable.
+    cache = getattr(_prepared_matchers, 'by_keys', None)
+    if cache is None:
+        cache = _prepared_matchers.by_keys = {}
+    entry = cache.get(id(keys))
+    if entry is None or entry[0] is not keys:
+        entry = cache[id(keys)] = (keys, [difflib.SequenceMatcher(None, '', key) for key in keys])
+    return entry[1]
+
+
+def _score_search_keys(query, keys, threshold=0.4):
+    # {index: score} for every key whose similarity to query reaches threshold. Keys and query
+    # are compared stripped and lower-cased: an exact match scores 1.0, a substring either way
+    # 0.85, anything else difflib's ratio from the per-key prepared matchers; empty keys never
+    # match. rapidfuzz's ratio is based on the longest common subsequence, which difflib's
+    # matching blocks never exceed, so it is never below difflib's ratio: keys one
+    # process.extract call rejects are skipped without changing the result.
+    query = query.strip().lower()
+    if not query:
+        return {}
+    candidates = None
+    if process is not None:
+        candidates = {
+            i for _, _, i in
+            process.extract(query, keys, scorer=fuzz.ratio, score_cutoff=threshold * 100 - 1e-6, limit=None)
+        }
+    scores = {}
+    for i, (key, matcher) in enumerate(zip(keys, _matchers_for(keys))):
+        if not key:
+            continue
+        if key == query:
+            score = 1.0
+        elif query in key or key in query:
+            score = 0.85
+        elif candidates is not None and i not in candidates:
+            continue
+        else:
+            matcher.set_seq1(query)
+            score = matcher.ratio()
+        if score >= threshold:
+            scores[i] = score
+    return scores
+
+
 def search_similar_courses_rdf(title_query: str, description_query: str = None, limit: int = 10):
-    if not _rdf_graph:
+    if not _OBJECTS_INDEX:
         return []
     title_query = _text(title_query)
     description_query = _text(description_query)
@@ -447,25 +670,133 @@ def search_similar_courses_rdf(title_query: str, description_query: str = None,
     if not query:
         return []
 
-    scored = []
-    for course in _rdf_graph.subjects(RDF.type, SCHEMA.Course):
-        name = _first_literal(course, SCHEMA.name) or ''
-        desc = _first_literal(course, SCHEMA.description) or ''
-        # score based on provided fields, prefer title match
-        score_title = _string_similarity(query, name) if title_query else 0.0
-        score_desc = _string_similarity(query, desc) if description_query and not title_query else 0.0
-        score = max(score_title, score_desc)
-        if score >= 0.4:  # basic threshold to filter noise
-            summary = _summarize_course_for_search(course)
-            summary['match'] = {
-                'title': name,
-                'description_present': bool(desc),
-                'score': round(score, 3)
-            }
-            scored.append(summary)
-
-    scored.sort(key=lambda x: x['match']['score'], reverse=True)
-    return scored[:limit]
+    # score based on provided fields, prefer title match
+    keys = _COURSE_NAME_KEYS if title_query else _COURSE_DESC_KEYS
+    scored = [(score,) + _COURSE_SEARCH_ROWS[i] for i, score in sorted(_score_search_keys(query, keys).items())]
+
+    # Rank first and only summarize the courses that are actually returned
+    scored.sort(key=lambda x: round(x[0], 3), reverse=True)
+    results = []
+    for score, course, name, desc in scored[:limit]:
+        # copy so the memoized summary is not mutated by the match info
+        summary = dict(_summarize_course_for_search(course))
+        summary['match'] = {
+            'title': name,
+            'description_present': bool(desc),
+            'score': round(score, 3)
+        }
+        results.append(summary)
+    return results
+
+
+_RDF_CACHED_FUNCTIONS = (
+    _first_literal,
+    _bool_value,
+    _get_level_value,
+    list_courses_from_rdf,
+    _course_list_totals,
+    course_detail_from_rdf,
+    _summarize_course_for_search,
+)
+
+
+# Search results per normalized title. The search pages see the same titles over and over;
+# entries expire after five minutes and are dropped whenever course data is written.
+_search_cache = TTLCache(maxsize=512, ttl=300)
+_search_cache_lock = threading.RLock()
+
+
+def _cached_search(title):
+    key = title.strip().lower()
+    with _search_cache_lock:
+        results = _search_cache.get(key)
+    if results is None:
+        results = search_similar_courses_rdf(title, None)
+        with _search_cache_lock:
+            _search_cache[key] = results
+    return results
+
+
+def _clear_search_cache():
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
+# Bumped whenever the RDF-derived caches are dropped, so anything keyed on it goes stale too
+_rdf_version = 0
+
+
+def invalidate_rdf_cache():
+    global _rdf_version
+    for func in _RDF_CACHED_FUNCTIONS:
+        app.logger.debug('RDF cache %s: %s', func.__name__, func.cache_info())
+        func.cache_clear()
+    _rdf_version += 1
+    _clear_search_cache()
+
+
+def _cached_list_courses():
+    # Memoized course list; empty when no RDF file was loaded
+    return list_courses_from_rdf() if _OBJECTS_INDEX else []
+
+
+_rdf_stats_cache = (None, None)
+
+
+def _rdf_stats():
+    # (file_exists, triple_count) for /status, re-checked only when _rdf_version moves
+    global _rdf_stats_cache
+    version, stats = _rdf_stats_cache
+    if version != _rdf_version:
+        stats = (os.path.exists(RDF_FILE), _rdf_triple_count)
+        _rdf_stats_cache = (_rdf_version, stats)
+    return stats
+
+
+def _etag_seed():
+    # Signature (mtime_ns, size) of output.nt and every template, so regenerating the graph or
+    # deploying new templates and restarting never revalidates a page rendered from the old ones
+    paths = [RDF_FILE]
+    template_root = os.path.join(app.root_path, app.template_folder)
+    for root, _dirs, files in os.walk(template_root):
+        paths.extend(os.path.join(root, name) for name in files)
+    signature = []
+    for path in sorted(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        signature.append(f'{path}:{st.st_mtime_ns}:{st.st_size}')
+    return hashlib.md5('|'.join(signature).encode()).hexdigest()
+
+
+_ETAG_SEED = _etag_seed()
+
+
+def _rdf_etag(*parts):
+    # Validator for responses derived only from the RDF views and templates: changes with the
+    # inputs, the files on disk at startup, or _rdf_version
+    return hashlib.md5(':'.join(str(p) for p in (*parts, _ETAG_SEED, _rdf_version)).encode()).hexdigest()
+
+
+def _flashes_pending():
+    # Flashed messages are rendered by base.html, so a page carrying them must not be cached or revalidated
+    return bool(request_ctx.flashes or session.get('_flashes'))
+
+
+def _with_etag(response, etag):
+    response = make_response(response)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, max-age=60'
+    return response
+
+
+def _not_modified(etag):
+    return _with_etag(app.response_class(status=304), etag)
+
+
+# Warm the course list at startup so the first /courses request does not pay for the scan
+_cached_list_courses()
 
 
 def init_neo4j_connection():
@@ -473,234 +804,542 @@ def init_neo4j_connection():
     uri = env_values.get('NEO4J_URI') or 'bolt://localhost:7687'
     username = env_values.get('NEO4J_USER') or 'neo4j'
     password = env_values.get('NEO4J_PASSWORD')
-    # Use a short connection timeout so health checks fail fast if DB is unavailable
+    # Use a short connection timeout so health checks fail fast if DB is unavailable. The pool
+    # is sized for the request threads plus the background writers; a request that cannot get a
+    # connection within 5s fails instead of queueing, and managed transactions stop retrying
+    # transient errors after 10s
     try:
-        driver = GraphDatabase.driver(uri, auth=(username, password), connection_timeout=3)
+        driver = GraphDatabase.driver(uri, auth=(username, password), connection_timeout=3,
+                                      max_connection_pool_size=32, connection_acquisition_timeout=5,
+                                      keep_alive=True, max_transaction_retry_time=10)
     except TypeError:
         # Older driver versions may not support connection_timeout; fall back gracefully
         driver = GraphDatabase.driver(uri, auth=(username, password))
     return driver
 
 
+# A single driver (and its Bolt connection pool) is shared by all requests. Building the
+# driver does not connect, so this is safe even when Neo4j is not running.
+_driver = None
+try:
+    _driver = init_neo4j_connection()
+except Exception:
+    _driver = None
+
+
+# Schema for the keys every MATCH/MERGE looks nodes up by. Nodes merged on a single key get a
+# uniqueness constraint; Facilitator and EducationalResource merge on several properties, so a
+# constraint on one of them would reject writes and they keep plain indexes.
+_COURSE_TITLE_CONSTRAINT = "CREATE CONSTRAINT course_title_unique IF NOT EXISTS FOR (c:Course) REQUIRE c.title IS UNIQUE"
+_COURSE_TITLE_INDEX = "CREATE INDEX course_title IF NOT EXISTS FOR (c:Course) ON (c.title)"
+_NEO4J_INDEXES = [
+    "CREATE CONSTRAINT addres_url_unique IF NOT EXISTS FOR (a:AdditionalResource) REQUIRE a.url IS UNIQUE",
+    "CREATE INDEX user_username IF NOT EXISTS FOR (u:User) ON (u.username)",
+    "CREATE INDEX facilitator_email IF NOT EXISTS FOR (f:Facilitator) ON (f.email)",
+    "CREATE INDEX edres_url IF NOT EXISTS FOR (e:EducationalResource) ON (e.url)",
+    # Backs the title searches, which would otherwise scan every Course for CONTAINS
+    "CREATE FULLTEXT INDEX course_title_fts IF NOT EXISTS FOR (c:Course) ON EACH [c.title, c.course_topics]",
+]
+_neo4j_indexes_ready = False
+
+
+def _run_schema_statement(session, statement):
+    # A statement the server rejects is reported and skipped so the rest still apply;
+    # connection errors propagate and the background bootstrap retries later
+    try:
+        session.run(statement).consume()
+        return True
+    except Neo4jError as exc:
+        app.logger.warning('Neo4j rejected schema statement %r: %s', statement, exc)
+        return False
+
+
+# Error codes meaning an existing index on Course.title is what blocks the constraint
+_SCHEMA_CONFLICT_CODES = frozenset({
+    'Neo.ClientError.Schema.IndexAlreadyExists',
+    'Neo.ClientError.Schema.EquivalentSchemaRuleAlreadyExists',
+})
+
+
+_DUPLICATE_COURSE_TITLES_CYPHER = """
+    MATCH (c:Course) WHERE c.title IS NOT NULL
+    WITH c.title AS title, count(*) AS copies WHERE copies > 1
+    RETURN count(title) AS duplicated
+"""
+
+
+def _ensure_course_title_constraint(session):
+    # The constraint cannot coexist with the plain course_title index earlier versions created,
+    # so that index is dropped only when the server names it as the conflict and no duplicate
+    # titles would make the constraint fail anyway. Any other refusal (e.g.
+    # ConstraintCreationFailed) leaves the index alone, so restarts never rebuild it and
+    # Course MERGEs never lose it.
+    try:
+        session.run(_COURSE_TITLE_CONSTRAINT).consume()
+        return
+    except Neo4jError as exc:
+        if exc.code not in _SCHEMA_CONFLICT_CODES:
+            app.logger.warning('Neo4j rejected schema statement %r: %s', _COURSE_TITLE_CONSTRAINT, exc)
+            _run_schema_statement(session, _COURSE_TITLE_INDEX)
+            return
+    if session.run(_DUPLICATE_COURSE_TITLES_CYPHER).single()['duplicated']:
+        app.logger.warning('Duplicate Course titles block %r; keeping the plain course_title index',
+                           _COURSE_TITLE_CONSTRAINT)
+        return
+    _run_schema_statement(session, "DROP INDEX course_title IF EXISTS")
+    if not _run_schema_statement(session, _COURSE_TITLE_CONSTRAINT):
+        _run_schema_statement(session, _COURSE_TITLE_INDEX)
+
+
+def _ensure_neo4j_indexes(driver):
+    # Applies the schema and warms the plan cache; True once that has succeeded in this process
+    global _neo4j_indexes_ready
+    if _neo4j_indexes_ready:
+        return True
+    try:
+        with driver.session() as session:
+            _ensure_course_title_constraint(session)
+            for statement in _NEO4J_INDEXES:
+                _run_schema_statement(session, statement)
+            _warm_neo4j_plans(session)
+        _neo4j_indexes_ready = True
+    except Exception:
+        pass
+    return _neo4j_indexes_ready
+
+
+_neo4j_bootstrap_lock = threading.Lock()
+_neo4j_bootstrap_thread = None
+
+
+def _neo4j_bootstrap_loop():
+    # Retries with exponential backoff (1s up to 60s) while Neo4j is unreachable
+    delay = 1.0
+    while True:
+        try:
+            if _ensure_neo4j_indexes(_shared_driver()):
+                return
+        except Exception:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 60.0)
+
+
+def _start_neo4j_bootstrap():
+    # The bootstrap only ever runs on this one background thread, so requests never wait on it
+    # or repeat it; restarted if its thread is gone (e.g. in a worker forked after import)
+    global _neo4j_bootstrap_thread
+    with _neo4j_bootstrap_lock:
+        if _neo4j_indexes_ready or (_neo4j_bootstrap_thread is not None and _neo4j_bootstrap_thread.is_alive()):
+            return
+        _neo4j_bootstrap_thread = threading.Thread(target=_neo4j_bootstrap_loop, name='neo4j-bootstrap', daemon=True)
+        _neo4j_bootstrap_thread.start()
+
+
+_driver_lock = threading.Lock()
+
+
+def _shared_driver():
+    # Rebuilt lazily if construction failed at import time; the lock keeps it to one driver
+    global _driver
+    if _driver is None:
+        with _driver_lock:
+            if _driver is None:
+                _driver = init_neo4j_connection()
+    return _driver
+
+
+def get_driver():
+    driver = _shared_driver()
+    if not _neo4j_indexes_ready:
+        _start_neo4j_bootstrap()
+    return driver
+
+
+def _close_driver():
+    if _driver is not None:
+        try:
+            _driver.close()
+        except Exception:
+            pass
+
+
+atexit.register(_close_driver)
+
+
+# (key, label) pairs checked by find_empty_fields, in the order they are reported
+_FACILITATOR_FIELDS = [('name', 'Name'), ('affiliation', 'Affiliation'), ('email', 'Email'), ('roles', 'Roles')]
+_COURSE_FIELDS = [
+    ('title', 'Course Title'),
+    ('description', 'Course Description'),
+    ('notional_hours', 'Notional Hours'),
+    ('topics', 'Course Topics'),
+    ('learning_outcomes', 'Course Learning Outcomes'),
+    ('targeted_skills', 'Targeted Skills'),
+    ('educational_level', 'Educational Level'),
+    ('language', 'Language'),
+    ('entry_requirements', 'Entry Requirements'),
+    ('required_software', 'Required Software'),
+]
+_EDUCATIONAL_RESOURCE_FIELDS = [('title', 'Title'), ('url', 'URL'), ('type', 'Type')]
+_ADDITIONAL_RESOURCE_FIELDS = [('type', 'Type'), ('url', 'URL')]
+
+
 def find_empty_fields(facilitators, course_data, educational_resources, additional_resources):
     empty_fields = []
     for i, facilitator in enumerate(facilitators):
-        if not facilitator.get('name'):
-            empty_fields.append(f"Facilitator {i + 1} Name")
-        if not facilitator.get('affiliation'):
-            empty_fields.append(f"Facilitator {i + 1} Affiliation")
-        if not facilitator.get('email'):
-            empty_fields.append(f"Facilitator {i + 1} Email")
-        if not facilitator.get('roles'):
-            empty_fields.append(f"Facilitator {i + 1} Roles")
-
-    if not course_data.get('title'):
-        empty_fields.append("Course Title")
-    if not course_data.get('description'):
-        empty_fields.append("Course Description")
-    if not course_data.get('notional_hours'):
-        empty_fields.append("Notional Hours")
-    if not course_data.get('topics'):
-        empty_fields.append("Course Topics")
-    if not course_data.get('learning_outcomes'):
-        empty_fields.append("Course Learning Outcomes")
-    if not course_data.get('targeted_skills'):
-        empty_fields.append("Targeted Skills")
-
-    if not course_data.get('educational_level'):
-        empty_fields.append("Educational Level")
-    if not course_data.get('language'):
-        empty_fields.append("Language")
-    if not course_data.get('entry_requirements'):
-        empty_fields.append("Entry Requirements")
-    if not course_data.get('required_software'):
-        empty_fields.append("Required Software")
+        empty_fields.extend(f"Facilitator {i + 1} {label}" for key, label in _FACILITATOR_FIELDS if not facilitator.get(key))
+
+    empty_fields.extend(label for key, label in _COURSE_FIELDS if not course_data.get(key))
 
     for i, resource in enumerate(educational_resources):
-        if not resource.get('title'):
-            empty_fields.append(f"Educational Resource {i + 1} Title")
-        if not resource.get('url'):
-            empty_fields.append(f"Educational Resource {i + 1} URL")
-        if not resource.get('type'):
-            empty_fields.append(f"Educational Resource {i + 1} Type")
+        empty_fields.extend(f"Educational Resource {i + 1} {label}" for key, label in _EDUCATIONAL_RESOURCE_FIELDS if not resource.get(key))
 
     for i, resource in enumerate(additional_resources):
-        if not resource.get('type'):
-            empty_fields.append(f"Additional Resource {i + 1} Type")
-        if not resource.get('url'):
-            empty_fields.append(f"Additional Resource {i + 1} URL")
+        empty_fields.extend(f"Additional Resource {i + 1} {label}" for key, label in _ADDITIONAL_RESOURCE_FIELDS if not resource.get(key))
 
     return empty_fields
 
 
+# Course node property -> course_data key, written in one SET c += $props
+_COURSE_PROPERTIES = [
+    ('description', 'description'),
+    ('notional_hours', 'notional_hours'),
+    ('course_topics', 'topics'),
+    ('learning_outcomes', 'learning_outcomes'),
+    ('targeted_skills', 'targeted_skills'),
+    ('educational_level', 'educational_level'),
+    ('language', 'language'),
+    ('entry_requirements', 'entry_requirements'),
+    ('required_software', 'required_software'),
+]
+
+
+# Cypher statements are fixed module-level strings with every value passed as a parameter,
+# so Neo4j's query cache reuses one plan per statement.
+_STORE_COURSE_CYPHER = """
+    MERGE (c:Course {title: $course_title})
+    SET c += $props
+    WITH c
+    CALL {
+        WITH c
+        MATCH (u:User {username: $username})
+        MERGE (u)-[:CREATED]->(c)
+    }
+    CALL {
+        WITH c
+        UNWIND $facilitators AS r
+        MERGE (f:Facilitator {name: r.name, affiliation: r.affiliation, email: r.email})
+        SET f.roles = r.roles
+        MERGE (f)-[:FACILITATES]->(c)
+    }
+    CALL {
+        WITH c
+        UNWIND $educational_resources AS r
+        MERGE (e:EducationalResource {title: r.title, url: r.url})
+        SET e.type = r.type
+        MERGE (c)-[:INCLUDES_RESOURCE]->(e)
+    }
+    CALL {
+        WITH c
+        UNWIND $additional_resources AS r
+        MERGE (a:AdditionalResource {url: r.url})
+        SET a.type = r.type
+        MERGE (c)-[:HAS_ADDITIONAL_RESOURCE]->(a)
+    }
+"""
+
+
+def _store_course_tx(tx, username, facilitators, course_data, educational_resources, additional_resources):
+    # One statement per course: the Course MERGE binds c, then each unit subquery links the
+    # user and UNWINDs one batch of rows onto it. Unit subqueries keep the course row even
+    # when the user is unknown or a list is empty.
+    tx.run(
+        _STORE_COURSE_CYPHER,
+        course_title=course_data.get('title'),
+        props={prop: course_data.get(key) for prop, key in _COURSE_PROPERTIES},
+        username=username,
+        facilitators=[{
+            'name': f.get('name'),
+            'affiliation': f.get('affiliation'),
+            'email': f.get('email'),
+            'roles': f.get('roles')
+        } for f in facilitators],
+        educational_resources=[
+            {'title': r.get('title'), 'url': r.get('url'), 'type': r.get('type')} for r in educational_resources
+        ],
+        additional_resources=[{'url': r.get('url'), 'type': r.get('type')} for r in additional_resources]
+    )
+
+
+def _read(work, *args, **session_config):
+    # Read-only work runs as a managed read transaction, so a cluster can route it to a
+    # follower and the driver retries it on transient errors
+    with get_driver().session(default_access_mode=READ_ACCESS, **session_config) as session:
+        return session.execute_read(work, *args)
+
+
 def store_course_data(username, facilitators, course_data, educational_resources, additional_resources):
-    driver = init_neo4j_connection()
-    with driver.session() as session:
-        # Create or merge Course node
-        session.run(
-            """
-            MERGE (c:Course {title: $course_title})
-            SET c.description = $course_description,
-                c.notional_hours = $notional_hours,
-                c.course_topics = $course_topics,
-                c.learning_outcomes = $learning_outcomes,
-                c.targeted_skills = $targeted_skills,
-                c.educational_level = $educational_level,
-                c.language = $language,
-                c.entry_requirements = $entry_requirements,
-                c.required_software = $required_software
-            """,
-            course_title=course_data.get('title'),
-            course_description=course_data.get('description'),
-            notional_hours=course_data.get('notional_hours'),
-            course_topics=course_data.get('topics'),
-            learning_outcomes=course_data.get('learning_outcomes'),
-            targeted_skills=course_data.get('targeted_skills'),
-            educational_level=course_data.get('educational_level'),
-            language=course_data.get('language'),
-            entry_requirements=course_data.get('entry_requirements'),
-            required_software=course_data.get('required_software')
-        )
+    with get_driver().session() as session:
+        # All writes for one course commit together in a single transaction
+        session.execute_write(_store_course_tx, username, facilitators, course_data,
+                              educational_resources, additional_resources)
+    _clear_search_cache()
+    _clear_neo4j_read_cache()
 
-        # Link course to user who created it
-        if username:
-            session.run(
-                """
-                MATCH (u:User {username: $username}), (c:Course {title: $course_title})
-                MERGE (u)-[:CREATED]->(c)
-                """,
-                username=username,
-                course_title=course_data.get('title')
-            )
-
-        # Create facilitators and link
-        for facilitator in facilitators:
-            session.run(
-                """
-                MERGE (f:Facilitator {name: $facilitator_name, affiliation: $affiliation, email: $email})
-                SET f.roles = $roles
-                MERGE (c:Course {title: $course_title})
-                MERGE (f)-[:FACILITATES]->(c)
-                """,
-                facilitator_name=facilitator.get('name'),
-                affiliation=facilitator.get('affiliation'),
-                email=facilitator.get('email'),
-                roles=facilitator.get('roles'),
-                course_title=course_data.get('title')
-            )
-
-        # Educational resources
-        for resource in educational_resources:
-            session.run(
-                """
-                MERGE (e:EducationalResource {title: $resource_title, url: $resource_url})
-                SET e.type = $resource_type
-                MERGE (c:Course {title: $course_title})
-                MERGE (c)-[:INCLUDES_RESOURCE]->(e)
-                """,
-                resource_title=resource.get('title'),
-                resource_url=resource.get('url'),
-                resource_type=resource.get('type'),
-                course_title=course_data.get('title')
-            )
-
-        # Additional resources
-        for resource in additional_resources:
-            session.run(
-                """
-                MERGE (a:AdditionalResource {url: $additional_url})
-                SET a.type = $additional_type
-                MERGE (c:Course {title: $course_title})
-                MERGE (c)-[:HAS_ADDITIONAL_RESOURCE]->(a)
-                """,
-                additional_url=resource.get('url'),
-                additional_type=resource.get('type'),
-                course_title=course_data.get('title')
-            )
-
-    driver.close()
 
+# Course writes run off the request thread. The last few submissions per user are kept so
+# add_course can show which are still pending or have failed.
+_write_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='course-write')
+_write_jobs = defaultdict(lambda: deque(maxlen=10))
+_write_jobs_lock = threading.Lock()
 
-def search_similar_courses(course_title):
-    driver = init_neo4j_connection()
-    with driver.session() as session:
-        results = session.run(
-            """
-            MATCH (c:Course)
-            WHERE c.title CONTAINS $course_title
-            OPTIONAL MATCH (c)-[:FACILITATES]-(f:Facilitator)
-            OPTIONAL MATCH (c)-[:INCLUDES_RESOURCE]->(e:EducationalResource)
-            RETURN c.title AS course_title,
-                   c.course_topics AS course_topics,
-                   COLLECT(DISTINCT f.name) AS facilitators,
-                   c.educational_level AS educational_level,
-                   c.language AS language,
-                   COLLECT(DISTINCT {title: e.title, url: e.url}) AS educational_resources
-            """,
-            course_title=course_title
-        )
 
-        out = []
-        for record in results:
-            out.append({
-                'course_title': record['course_title'],
-                'course_topics': record['course_topics'],
-                'facilitators': record['facilitators'],
-                'educational_level': record['educational_level'],
-                'language': record['language'],
-                'educational_resources': [ {'title': er['title'], 'url': er['url']} for er in record['educational_resources'] if er and er.get('title')]
-            })
-        driver.close()
-        return out
-
-
-def find_complementary_content(course_title, existing_resources_titles):
-    driver = init_neo4j_connection()
-    with driver.session() as session:
-        results = session.run(
-            """
-            MATCH (c:Course)-[:INCLUDES_RESOURCE]->(e:EducationalResource)
-            WHERE c.title CONTAINS $course_title AND NOT e.title IN $existing_resources_titles
-            RETURN DISTINCT e.title AS title, e.url AS url
-            """,
-            course_title=course_title,
-            existing_resources_titles=existing_resources_titles
-        )
+def _run_course_write(job, args):
+    try:
+        store_course_data(*args)
+        status = 'stored'
+    except Exception:
+        app.logger.exception('Storing course %r failed', job['title'])
+        status = 'failed'
+    with _write_jobs_lock:
+        job['status'] = status
+
+
+def submit_course_data(username, facilitators, course_data, educational_resources, additional_resources):
+    job = {
+        'title': course_data.get('title') or 'Untitled course',
+        'status': 'pending',
+        'submitted': datetime.now(timezone.utc),
+    }
+    with _write_jobs_lock:
+        _write_jobs[username].append(job)
+    _write_executor.submit(_run_course_write, job,
+                           (username, facilitators, course_data, educational_resources, additional_resources))
+    return job
+
+
+def recent_course_writes(username):
+    # Newest first; copies so templates never see a job mid-update
+    with _write_jobs_lock:
+        return [dict(job) for job in reversed(_write_jobs.get(username, ()))]
+
+
+# Facilitators and resources are aggregated in separate subqueries so they never cross-multiply
+_SIMILAR_COURSES_CYPHER = """
+    CALL db.index.fulltext.queryNodes('course_title_fts', $query) YIELD node AS c, score
+    WHERE score > 0.1
+    CALL {
+        WITH c
+        MATCH (c)-[:FACILITATES]-(f:Facilitator)
+        RETURN COLLECT(DISTINCT f.name) AS facilitators
+    }
+    CALL {
+        WITH c
+        MATCH (c)-[:INCLUDES_RESOURCE]->(e:EducationalResource)
+        WHERE e.title IS NOT NULL
+        RETURN COLLECT(DISTINCT {title: e.title, url: e.url}) AS educational_resources
+    }
+    RETURN c.title AS course_title,
+           c.course_topics AS course_topics,
+           facilitators,
+           c.educational_level AS educational_level,
+           c.language AS language,
+           educational_resources
+"""
+
+
+# Neo4j read results for repeated titles, kept for a minute and dropped by store_course_data
+_neo4j_read_cache = TTLCache(maxsize=256, ttl=60)
+_neo4j_read_cache_lock = threading.RLock()
+
+
+def _clear_neo4j_read_cache():
+    with _neo4j_read_cache_lock:
+        _neo4j_read_cache.clear()
+
 
-        out = [ {'Title': r['title'], 'URL': r['url']} for r in results ]
-        driver.close()
-        return out
+# Approximates the index's StandardTokenizer: words split on punctuation, except that a '.' or an
+# apostrophe between word characters joins them into one token, as in "2.0" or "don't"
+_FULLTEXT_WORD_RE = re.compile(r"\w+(?:[.'\u2019]\w+)*")
+
+
+def _fulltext_query(text):
+    # Lucene query for course_title_fts: every token of the title, prefix-matched, so no term
+    # requires a token the index never stores. '.' and apostrophes are not Lucene syntax, so the
+    # tokens need no escaping.
+    return ' AND '.join(word + '*' for word in _FULLTEXT_WORD_RE.findall((text or '').lower()))
+
+
+def _similar_courses_tx(tx, query):
+    # Resources without a title are dropped in Cypher, so rows map 1:1 onto the output
+    return [record.data() for record in tx.run(_SIMILAR_COURSES_CYPHER, query=query)]
+
+
+@cached(_neo4j_read_cache, lock=_neo4j_read_cache_lock,
+        key=lambda course_title: hashkey('similar', course_title))
+def search_similar_courses(course_title):
+    query = _fulltext_query(course_title)
+    if not query:
+        return []
+    # fetch_size=-1 pulls every matching course in one round trip
+    return _read(_similar_courses_tx, query, fetch_size=-1)
+
+
+_COMPLEMENTARY_CONTENT_CYPHER = """
+    CALL db.index.fulltext.queryNodes('course_title_fts', $query) YIELD node AS c, score
+    WHERE score > 0.1
+    MATCH (c)-[:INCLUDES_RESOURCE]->(e:EducationalResource)
+    WHERE NOT e.title IN $existing_resources_titles
+    WITH DISTINCT e.title AS title, e.url AS url
+    ORDER BY title, url
+    SKIP $offset LIMIT $limit
+    RETURN COLLECT({Title: title, URL: url}) AS resources
+"""
+COMPLEMENTARY_CONTENT_LIMIT = 50
+
+
+def _complementary_content_tx(tx, query, existing_resources_titles, limit, offset):
+    # Collected server-side into a single row instead of one row per resource; only one
+    # page is ever transferred, in a stable order so offsets line up between calls
+    record = tx.run(
+        _COMPLEMENTARY_CONTENT_CYPHER,
+        query=query,
+        existing_resources_titles=existing_resources_titles,
+        limit=limit,
+        offset=offset
+    ).single()
+    return record['resources'] if record else []
+
+
+@cached(_neo4j_read_cache, lock=_neo4j_read_cache_lock,
+        key=lambda course_title, existing_resources_titles, limit=COMPLEMENTARY_CONTENT_LIMIT, offset=0:
+            hashkey('complementary', course_title, tuple(existing_resources_titles), limit, offset))
+def find_complementary_content(course_title, existing_resources_titles, limit=COMPLEMENTARY_CONTENT_LIMIT, offset=0):
+    query = _fulltext_query(course_title)
+    if not query:
+        return []
+    return _read(_complementary_content_tx, query, list(existing_resources_titles), int(limit), int(offset))
+
+
+_GET_USER_CYPHER = "MATCH (u:User {username: $username}) RETURN u.username AS username, u.email AS email"
+_GET_USER_HASH_CYPHER = "MATCH (u:User {username: $username}) RETURN u.password_hash AS pw"
+_CREATE_USER_CYPHER = "MERGE (u:User {username: $username}) SET u.email = $email, u.password_hash = $password_hash"
+
+# Every statement the app runs, with placeholder parameters of the types it is called with
+_NEO4J_WARM_QUERIES = [
+    (_SIMILAR_COURSES_CYPHER, {'query': 'warm*'}),
+    (_COMPLEMENTARY_CONTENT_CYPHER, {'query': 'warm*', 'existing_resources_titles': [],
+                                     'limit': COMPLEMENTARY_CONTENT_LIMIT, 'offset': 0}),
+    (_STORE_COURSE_CYPHER, {'course_title': '', 'props': {}, 'username': '', 'facilitators': [],
+                            'educational_resources': [], 'additional_resources': []}),
+    (_GET_USER_CYPHER, {'username': ''}),
+    (_GET_USER_HASH_CYPHER, {'username': ''}),
+    (_CREATE_USER_CYPHER, {'username': '', 'email': '', 'password_hash': ''}),
+]
+
+
+def _warm_neo4j_plans(session):
+    # EXPLAIN plans a statement without running it, so the server's plan cache is populated
+    # before the first real request; a statement that fails to plan is simply left cold
+    for statement, params in _NEO4J_WARM_QUERIES:
+        try:
+            session.run('EXPLAIN ' + statement, params).consume()
+        except Neo4jError:
+            pass
 
 
 def get_user(username):
-    driver = init_neo4j_connection()
-    with driver.session() as session:
-        res = session.run("MATCH (u:User {username: $username}) RETURN u.username AS username, u.email AS email", username=username)
-        rec = res.single()
-    driver.close()
-    return rec
+    return _read(lambda tx: tx.run(_GET_USER_CYPHER, username=username).single())
+
+
+def _hash_password(password_plain):
+    if _password_hasher is not None:
+        return _password_hasher.hash(password_plain)
+    return generate_password_hash(password_plain)
+
+
+def _check_password(password_hash, password_plain):
+    if password_hash.startswith('$argon2'):
+        if _password_hasher is None:
+            return False
+        try:
+            return _password_hasher.verify(password_hash, password_plain)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password_plain)
+
+
+# Stored hashes are cached so repeated logins skip the Neo4j lookup. create_user clears the
+# cache in its own process; the TTL bounds how long other workers can accept a replaced password.
+_user_hash_cache = TTLCache(maxsize=1024, ttl=60)
+_user_hash_cache_lock = threading.RLock()
+
+
+def _clear_user_hash_cache():
+    with _user_hash_cache_lock:
+        _user_hash_cache.clear()
+
+
+@cached(_user_hash_cache, lock=_user_hash_cache_lock)
+def _get_user_hash(username):
+    rec = _read(lambda tx: tx.run(_GET_USER_HASH_CYPHER, username=username).single())
+    return rec.get('pw') if rec else None
 
 
 def create_user(username, email, password_plain):
-    password_hash = generate_password_hash(password_plain)
-    driver = init_neo4j_connection()
-    with driver.session() as session:
-        session.run("MERGE (u:User {username: $username}) SET u.email = $email, u.password_hash = $password_hash",
-                    username=username, email=email, password_hash=password_hash)
-    driver.close()
+    password_hash = _hash_password(password_plain)
+    with get_driver().session() as session:
+        # Managed like the course write, so transient errors are retried instead of surfacing
+        session.execute_write(lambda tx: tx.run(
+            _CREATE_USER_CYPHER, username=username, email=email, password_hash=password_hash).consume())
+    _clear_user_hash_cache()
 
 
 def verify_user(username, password_plain):
-    driver = init_neo4j_connection()
-    with driver.session() as session:
-        res = session.run("MATCH (u:User {username: $username}) RETURN u.password_hash AS pw", username=username)
-        rec = res.single()
-    driver.close()
-    if rec and rec.get('pw'):
-        return check_password_hash(rec['pw'], password_plain)
+    password_hash = _get_user_hash(username)
+    if password_hash and _check_password(password_hash, password_plain):
+        return True
+    # The cached entry may be stale (e.g. user created by another worker): re-read once
+    fresh_hash = _get_user_hash.__wrapped__(username)
+    if fresh_hash and fresh_hash != password_hash:
+        _clear_user_hash_cache()
+        return _check_password(fresh_hash, password_plain)
     return False
 
 
+# Repeated add_course inputs are named <group>_<field>_<index>, e.g. facilitator_roles_0
+_FIELD_RE = re.compile(r'^(facilitator|resource|additional)_([a-z_]+)_(\d{1,9})$')
+_LIST_FIELDS = frozenset({'roles', 'type', 'educational_level', 'language'})
+# Upper bound on rows per repeated group; larger indexes are rejected with 413
+MAX_ENTRIES = 200
+
+
+def _indexed_form_fields(form_lists):
+    # {group: {index: {field: value}}} from a {key: [values]} snapshot of the form
+    groups = defaultdict(dict)
+    for key, values in form_lists.items():
+        m = _FIELD_RE.match(key)
+        if not m:
+            continue
+        group, field, idx = m.group(1), m.group(2), int(m.group(3))
+        if idx >= MAX_ENTRIES:
+            abort(413)
+        groups[group].setdefault(idx, {})[field] = values if field in _LIST_FIELDS else values[0]
+    return groups
+
+
+def _form_rows(rows_by_index, required, fields):
+    # Rows 0, 1, ... up to the first one whose required field is empty
+    rows = []
+    for i in range(len(rows_by_index)):
+        row = rows_by_index.get(i)
+        if not row or not row.get(required):
+            break
+        rows.append({f: row.get(f, [] if f in _LIST_FIELDS else None) for f in fields})
+    return rows
+
+
 def login_required(func):
     from functools import wraps
 
@@ -730,19 +1369,62 @@ def inject_current_year():
     return {'current_year': datetime.now(timezone.utc).year}
 
 
+# Pages that are the same for every visitor are rendered once per process into the static
+# folder as _<template> and served from there (ETag revalidation, no re-render). Visits
+# carrying flashed messages, e.g. /welcome right after login/logout, still get a live render.
+_STATIC_PAGES = ('welcome.html', 'about.html', 'licensing.html', 'examples.html')
+_prerendered_pages = set()
+# The footer shows current_year, so the files are rendered again once the year moves on
+_prerendered_year = None
+_prerender_lock = threading.Lock()
+
+
+def _prerender_static_pages():
+    global _prerendered_year
+    _prerendered_year = datetime.now(timezone.utc).year
+    for template in _STATIC_PAGES:
+        with app.test_request_context('/'):
+            html = render_template(template)
+        path = os.path.join(app.static_folder, '_' + template)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as fh:
+                fh.write(html)
+            os.replace(tmp_path, path)
+            _prerendered_pages.add(template)
+        except OSError:
+            _prerendered_pages.discard(template)
+
+
+def _refresh_static_pages():
+    if datetime.now(timezone.utc).year != _prerendered_year:
+        with _prerender_lock:
+            if datetime.now(timezone.utc).year != _prerendered_year:
+                _prerender_static_pages()
+
+
+def _static_page(template):
+    _refresh_static_pages()
+    if template in _prerendered_pages and not session.get('_flashes'):
+        response = app.send_static_file('_' + template)
+        response.headers['Cache-Control'] = 'public, no-cache'
+        return response
+    return render_template(template)
+
+
 @app.route('/about')
 def about():
-    return render_template('about.html')
+    return _static_page('about.html')
 
 
 @app.route('/licensing')
 def licensing():
-    return render_template('licensing.html')
+    return _static_page('licensing.html')
 
 
 @app.route('/examples')
 def examples():
-    return render_template('examples.html')
+    return _static_page('examples.html')
 
 
 @app.route('/register', methods=['GET', 'POST'])
@@ -788,201 +1470,151 @@ def add_course():
     if request.method == 'POST':
         # parse form data
         username = session.get('username')
-        # Facilitators: we expect repeated fields facilitator_name_0..n
-        facilitators = []
-        i = 0
-        while True:
-            name = request.form.get(f'facilitator_name_{i}')
-            if not name:
-                break
-            facilitators.append({
-                'name': name,
-                'affiliation': request.form.get(f'facilitator_affiliation_{i}'),
-                'email': request.form.get(f'facilitator_email_{i}'),
-                'roles': request.form.getlist(f'facilitator_roles_{i}')
-            })
-            i += 1
+        # Repeated fields (facilitator_name_0..n, resource_title_0..n, additional_url_0..n)
+        # are grouped in a single pass over one {key: [values]} snapshot of the form
+        form = dict(request.form.lists())
+        get = form.get
+        indexed = _indexed_form_fields(form)
+        facilitators = _form_rows(indexed['facilitator'], 'name', ('name', 'affiliation', 'email', 'roles'))
 
         course_data = {
-            'title': request.form.get('course_title'),
-            'description': request.form.get('course_description'),
-            'notional_hours': request.form.get('notional_hours'),
-            'topics': request.form.get('course_topics'),
-            'learning_outcomes': request.form.get('learning_outcomes'),
-            'targeted_skills': request.form.get('targeted_skills'),
-            'educational_level': request.form.getlist('educational_level'),
-            'language': request.form.getlist('language'),
-            'entry_requirements': request.form.get('entry_requirements'),
-            'required_software': request.form.get('required_software')
+            'title': get('course_title', [None])[0],
+            'description': get('course_description', [None])[0],
+            'notional_hours': get('notional_hours', [None])[0],
+            'topics': get('course_topics', [None])[0],
+            'learning_outcomes': get('learning_outcomes', [None])[0],
+            'targeted_skills': get('targeted_skills', [None])[0],
+            'educational_level': get('educational_level', []),
+            'language': get('language', []),
+            'entry_requirements': get('entry_requirements', [None])[0],
+            'required_software': get('required_software', [None])[0]
         }
 
-        educational_resources = []
-        j = 0
-        while True:
-            title = request.form.get(f'resource_title_{j}')
-            if not title:
-                break
-            educational_resources.append({'title': title, 'url': request.form.get(f'resource_url_{j}'), 'type': request.form.getlist(f'resource_type_{j}')})
-            j += 1
-
-        additional_resources = []
-        k = 0
-        while True:
-            url = request.form.get(f'additional_url_{k}')
-            if not url:
-                break
-            additional_resources.append({'url': url, 'type': request.form.getlist(f'additional_type_{k}')})
-            k += 1
+        educational_resources = _form_rows(indexed['resource'], 'title', ('title', 'url', 'type'))
+        additional_resources = _form_rows(indexed['additional'], 'url', ('url', 'type'))
+
+        # Nothing filled in: skip validation and the Neo4j write entirely
+        if not (facilitators or educational_resources or additional_resources or any(course_data.values())):
+            flash('Nothing to save', 'info')
+            return redirect(url_for('add_course'))
 
         empty_fields = find_empty_fields(facilitators, course_data, educational_resources, additional_resources)
         if empty_fields:
             flash('Missing fields: ' + ', '.join(empty_fields), 'warning')
-        # store regardless of empties for now but link to user
-        store_course_data(username, facilitators, course_data, educational_resources, additional_resources)
-        flash('Course stored', 'success')
+        # store regardless of empties for now but link to user; the write itself happens in the background
+        submit_course_data(username, facilitators, course_data, educational_resources, additional_resources)
+        flash('Course submitted; it will be stored in the background', 'success')
         return redirect(url_for('add_course'))
 
-    return render_template('add_course.html')
+    return render_template('add_course.html', recent_writes=recent_course_writes(session.get('username')),
+                           max_entries=MAX_ENTRIES)
 
 
-@app.route('/create_course', methods=['GET', 'POST'])
-def create_course():
-    results = []
-    graph_data = None
-    show_builder = False
-    initial_title = ''
+def _posted_search_title():
+    # Stripped title from a course_search POST, or None when another form was posted
+    form = request.form
+    if form.get('form_name') != 'course_search':
+        return None
+    return (form.get('course_title') or '').strip()
+
+
+def _search_context(course_title, show_builder=True):
+    # Template context shared by the course_search pages
+    ctx = {'results': [], 'graph_data': None, 'show_builder': False, 'initial_title': course_title}
+    if course_title:
+        results = _cached_search(course_title)
+        if not results:
+            flash('No similar courses found in the knowledge graph', 'info')
+        else:
+            ctx.update(results=results, graph_data=results[0]['graph'], show_builder=show_builder)
+    return ctx
 
+
+def _handle_course_search(endpoint, template, *, show_builder=True, extra_ctx=None):
+    # A titled search POST redirects to ?title=..., so refreshes and caches reuse the GET that
+    # renders the results; an empty title re-renders the page with a warning.
     if request.method == 'POST':
-        form_name = request.form.get('form_name')
-        if form_name == 'course_search':
-            course_title = (request.form.get('course_title') or '').strip()
-            if not course_title:
-                flash('Please enter a course title to search.', 'warning')
-            else:
-                results = search_similar_courses_rdf(course_title, None)
-                if not results:
-                    flash('No similar courses found in the knowledge graph', 'info')
-                else:
-                    graph_data = results[0]['graph']
-                    show_builder = True
-                initial_title = course_title
-
-    return render_template(
-        'create_course.html',
-        results=results,
-        graph_data=graph_data,
-        show_builder=show_builder,
-        initial_title=initial_title
-    )
+        course_title = _posted_search_title()
+        if course_title:
+            return redirect(url_for(endpoint, title=course_title))
+        if course_title is not None:
+            flash('Please enter a course title to search.', 'warning')
+    ctx = _search_context((request.args.get('title') or '').strip(), show_builder)
+    return render_template(template, **ctx, **(extra_ctx or {}))
+
+
+@app.route('/create_course', methods=['GET', 'POST'])
+def create_course():
+    return _handle_course_search('create_course', 'create_course.html')
 
 
 # ISWC Test Use-Case: isolated Create page with minimal navbar
 @app.route('/test', methods=['GET', 'POST'])
 def create_course_test():
-    results = None
-    graph_data = None
-    initial_title = ''
-    show_builder = False
-
+    # Keeps the title in the session rather than the URL; the builder opens even without matches
     if request.method == 'POST':
-        form_name = request.form.get('form_name')
-        if form_name == 'course_search':
-            course_title = (request.form.get('course_title') or '').strip()
-            if course_title:
-                session['course_test_title'] = course_title
-            else:
-                flash('Please enter a course title to begin.', 'warning')
+        course_title = _posted_search_title()
+        if course_title:
+            session['course_test_title'] = course_title
+        elif course_title is not None:
+            flash('Please enter a course title to begin.', 'warning')
         return redirect(url_for('create_course_test'))
 
     stored_title = session.pop('course_test_title', None)
-    if stored_title:
-        initial_title = stored_title
-        show_builder = True
-        results = search_similar_courses_rdf(stored_title, None)
-        if not results:
-            results = []
-            flash('No similar courses found in the knowledge graph', 'info')
-        else:
-            graph_data = results[0]['graph']
-
-    return render_template(
-        'create_course_test.html',
-        results=results,
-        graph_data=graph_data,
-        show_builder=show_builder,
-        initial_title=initial_title
-    )
+    ctx = _search_context(stored_title or '')
+    ctx['show_builder'] = bool(stored_title)
+    return render_template('create_course_test.html', **ctx)
 
 
 @app.route('/complete_course', methods=['GET', 'POST'])
 def complete_course_route():
-    results = []
-    graph_data = None
-    show_builder = False
-    initial_title = ''
+    return _handle_course_search('complete_course_route', 'complete_course.html')
 
-    if request.method == 'POST':
-        form_name = request.form.get('form_name')
-        if form_name == 'course_search':
-            course_title = (request.form.get('course_title') or '').strip()
-            if not course_title:
-                flash('Please enter a course title to search.', 'warning')
-            else:
-                results = search_similar_courses_rdf(course_title, None)
-                if not results:
-                    flash('No similar courses found in the knowledge graph', 'info')
-                else:
-                    graph_data = results[0]['graph']
-                    show_builder = True
-                initial_title = course_title
-
-    return render_template(
-        'complete_course.html',
-        results=results,
-        graph_data=graph_data,
-        show_builder=show_builder,
-        initial_title=initial_title
-    )
+
+# GET pages whose HTML depends only on the URL. /test is left out: its results come from a
+# session value set just before the redirect, so a cached copy would hide a new search.
+_CACHEABLE_ENDPOINTS = frozenset({'courses', 'create_course', 'complete_course_route'})
+
+
+@app.after_request
+def cache_read_only_pages(response):
+    # Let the browser or an upstream cache reuse these for 30 s, unless flashed messages were involved
+    if (request.method == 'GET' and response.status_code == 200
+            and request.endpoint in _CACHEABLE_ENDPOINTS
+            and not _flashes_pending()):
+        response.headers['Cache-Control'] = 'private, max-age=30'
+        response.vary.add('Cookie')
+    return response
 
 
 # New routes to expose RDF-backed course retrieval
 @app.route('/welcome')
 def welcome():
-    return render_template('welcome.html')
+    return _static_page('welcome.html')
 @app.route('/courses', methods=['GET', 'POST'])
 def courses():
-    results = []
-    graph_data = None
-    show_builder = False
-    initial_title = ''
-
-    if request.method == 'POST':
-        form_name = request.form.get('form_name')
-        if form_name == 'course_search':
-            course_title = (request.form.get('course_title') or '').strip()
-            if not course_title:
-                flash('Please enter a course title to search.', 'warning')
-            else:
-                results = search_similar_courses_rdf(course_title, None)
-                if not results:
-                    flash('No similar courses found in the knowledge graph', 'info')
-                else:
-                    graph_data = results[0]['graph']
-                initial_title = course_title
-
-    courses_list = list_courses_from_rdf()
-    return render_template(
-        'courses.html',
-        courses=courses_list,
-        results=results,
-        graph_data=graph_data,
-        show_builder=show_builder,
-        initial_title=initial_title
-    )
+    # The catalog table is paginated; the summary cards still describe the whole catalog
+    page = max(1, request.args.get('page', 1, type=int))
+    size = min(100, max(1, request.args.get('size', 20, type=int)))
+    courses_list = _cached_list_courses()
+    total_topics, total_skills = _course_list_totals() if courses_list else (0, 0)
+    return _handle_course_search('courses', 'courses.html', show_builder=False, extra_ctx={
+        'courses': courses_list[(page - 1) * size:page * size],
+        'page': page,
+        'size': size,
+        'total': len(courses_list),
+        'total_topics': total_topics,
+        'total_skills': total_skills,
+    })
 
 
 @app.route('/courses/<path:course_id>')
 def course_detail(course_id):
+    # The page extends base.html, so pending flashes rule out both the 304 and the ETag
+    etag = None if _flashes_pending() else _rdf_etag(course_id, request.args.get('id'))
+    if etag and etag in request.if_none_match:
+        return _not_modified(etag)
+
     detail = course_detail_from_rdf(course_id)
     if not detail:
         # Also accept a query parameter ?id=... as a fallback for tricky encodings
@@ -992,7 +1624,15 @@ def course_detail(course_id):
     if not detail:
         flash('Course not found in knowledge graph', 'warning')
         return redirect(url_for('courses'))
-    return render_template('course_detail.html', course=detail)
+    # Streamed so the page head goes out while the topic tables render. Flashes are taken
+    # now: the session cookie is already sent by the time base.html would pop them. A page
+    # that carries them gets no validator and must not be stored at all.
+    get_flashed_messages(with_categories=True)
+    response = make_response(stream_template('course_detail.html', course=detail))
+    if etag:
+        return _with_etag(response, etag)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
 
 
 # Inline details fragment for Courses list (lazy-loaded)
@@ -1002,44 +1642,71 @@ def course_detail_fragment():
     if not course_id:
         return '<div class="alert alert-warning mb-0">Missing course identifier.</div>', 400
 
+    etag = _rdf_etag(course_id)
+    if etag in request.if_none_match:
+        return _not_modified(etag)
+
     detail = course_detail_from_rdf(course_id)
     if not detail:
         return '<div class="alert alert-warning mb-0">Course not found in the knowledge graph.</div>', 404
 
-    return render_template(
+    return _with_etag(render_template(
         '_course_details_fragment.html',
         course=detail
-    )
+    ), etag)
+
+
+# Details for every row on a /courses page in one round trip; ids are comma separated
+COURSE_DETAILS_BULK_MAX = 100
+
+
+@app.route('/courses/details_bulk')
+def course_detail_fragment_bulk():
+    ids_param = request.args.get('ids', '')
+    ids = [i for i in ids_param.split(',') if i][:COURSE_DETAILS_BULK_MAX]
+    if not ids:
+        return '<div class="alert alert-warning mb-0">Missing course identifiers.</div>', 400
+
+    etag = _rdf_etag(ids_param)
+    if etag in request.if_none_match:
+        return _not_modified(etag)
+
+    return _with_etag(render_template(
+        '_course_details_bulk_fragment.html',
+        details=course_details_from_rdf(ids)
+    ), etag)
+
+
+# (monotonic time, JSON body) of the last /status answer; health probes within
+# STATUS_CACHE_SECONDS get the same bytes without touching the graph or Neo4j
+STATUS_CACHE_SECONDS = 5.0
+_status_cache = (0.0, None)
 
 
 @app.route('/status')
 def status():
-    rdf_file_exists = os.path.exists(RDF_FILE)
-    triple_count = len(_rdf_graph) if _rdf_graph else 0
-    course_count = len(list_courses_from_rdf()) if _rdf_graph else 0
+    global _status_cache
+    cached_at, body = _status_cache
+    if body is not None and time.monotonic() - cached_at < STATUS_CACHE_SECONDS:
+        return app.response_class(body, mimetype='application/json')
+
+    rdf_file_exists, triple_count = _rdf_stats()
+    course_count = len(_cached_list_courses())
 
     neo4j = {
         'configured': bool(env_values.get('NEO4J_URI') or env_values.get('NEO4J_USER') or env_values.get('NEO4J_PASSWORD')),
         'connected': False
     }
 
-    driver = None
     try:
-        driver = init_neo4j_connection()
-        if driver:
-            with driver.session() as session:
-                session.run("RETURN 1 AS ok").single()
-            neo4j['connected'] = True
+        # Borrow a pooled connection instead of building and tearing down a driver per probe
+        with _shared_driver().session() as session:
+            session.run("RETURN 1 AS ok").single()
+        neo4j['connected'] = True
     except Exception as exc:
         neo4j['error'] = str(exc)
-    finally:
-        if driver:
-            try:
-                driver.close()
-            except Exception:
-                pass
-
-    return jsonify({
+
+    response = jsonify({
         'status': 'ok' if rdf_file_exists else 'degraded',
         'rdf': {
             'file': RDF_FILE,
@@ -1049,6 +1716,15 @@ def status():
         },
         'neo4j': neo4j
     })
+    _status_cache = (time.monotonic(), response.get_data())
+    return response
+
+
+_prerender_static_pages()
+
+# Connect, apply the schema and warm the plan cache in the background so the first request
+# does not pay for it; startup itself never waits on Neo4j
+_start_neo4j_bootstrap()
 
 
 if __name__ == '__main__':